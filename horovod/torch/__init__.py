@@ -31,6 +31,8 @@ except:
 
 from horovod.torch.compression import Compression
 from horovod.torch.mpi_ops import allreduce, allreduce_async, allreduce_, allreduce_async_
+from horovod.torch.mpi_ops import allreduce_batched, allreduce_async_batched
+from horovod.torch.mpi_ops import allreduce_async_multi, allreduce_async_multi_
 from horovod.torch.mpi_ops import allgather, allgather_async
 from horovod.torch.mpi_ops import broadcast, broadcast_async, broadcast_, broadcast_async_
 from horovod.torch.mpi_ops import poll, synchronize
@@ -126,6 +128,13 @@ class _DistributedOptimizer(torch.optim.Optimizer):
         handle = allreduce_async_(tensor_compressed, average=True, name=name)
         return handle, ctx
 
+    def _allreduce_grads_async(self, params):
+        names = [self._parameter_names.get(p) for p in params]
+        compressed = [self._compression.compress(p.grad.clone()) for p in params]
+        handles = allreduce_async_multi_([tensor for tensor, _ in compressed],
+                                         average=True, names=names)
+        return [(handle, ctx) for handle, (_, ctx) in zip(handles, compressed)]
+
     def _make_hook(self, p):
         def hook(*ignore):
             if p in self._handles and self._handles[p][0] is not None:
@@ -146,18 +155,14 @@ class _DistributedOptimizer(torch.optim.Optimizer):
         return hook
 
     def synchronize(self):
+        # Enqueue all outstanding allreduces before waiting on any of them.
         missing_p = self._requires_update - set(self._handles.keys())
-        for p in missing_p:
-            handle, ctx = self._allreduce_grad_async(p)
-            self._handles[p] = (handle, ctx)
-
-        for p, value in self._handles.items():
-            handle, ctx = value
-            if handle is None:
-                handle, ctx = self._allreduce_grad_async(p)
-                self._handles[p] = (handle, ctx)
+        pending = list(missing_p)
+        pending += [p for p, (handle, _) in self._handles.items() if handle is None]
+        for p, value in zip(pending, self._allreduce_grads_async(pending)):
+            self._handles[p] = value
 
-        for p, (handle, _) in self._handles_old.items():
+        for p, (handle, ctx) in self._handles_old.items():
             output = synchronize(handle)
             #self._allreduce_delay[p] = self.backward_passes_per_step
             #p.grad.set_(self._compression.decompress(output, ctx))
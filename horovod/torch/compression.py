@@ -19,6 +19,9 @@ import torch
 
 class Compressor(object):
     """Interface for compressing and decompressing a given tensor."""
+    # Type floating point tensors are cast to, or None if compression is not a cast.
+    compressed_dtype = None
+
     @staticmethod
     def compress(tensor):
         """Compresses a tensor and returns it with the context needed to decompress it."""
@@ -45,6 +48,8 @@ class NoneCompressor(Compressor):
 
 class FP16Compressor(Compressor):
     """Compress all floating point gradients to 16-bit."""
+    compressed_dtype = torch.float16
+
     @staticmethod
     def compress(tensor):
         """Downcasts the tensor to 16-bit."""
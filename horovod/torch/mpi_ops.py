@@ -18,15 +18,17 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from distutils.version import LooseVersion
-
 # Load all the necessary PyTorch C types.
 import torch
 
+import collections
+import itertools
+import os
+import threading
 import warnings
 
 # PyTorch v2 API starts with 1.0.0 (including nightly builds)
-_v2_api = LooseVersion(torch.__version__) >= LooseVersion('1.0.0')
+_v2_api = tuple(int(v) for v in torch.__version__.split('+', 1)[0].split('.')[:2]) >= (1, 0)
 if _v2_api:
     from horovod.torch import mpi_lib_v2 as mpi_lib
     from horovod.common.basics import HorovodBasics as _HorovodBasics
@@ -44,8 +46,6 @@ from horovod.common.util import get_average_backwards_compatibility_fun, gpu_ava
 from horovod.torch.compression import Compression
 
 # import basic methods
-init = _basics.init
-shutdown = _basics.shutdown
 size = _basics.size
 local_size = _basics.local_size
 rank = _basics.rank
@@ -68,21 +68,163 @@ is_homogeneous = _basics.is_homogeneous
 
 handle_average_backwards_compatibility = get_average_backwards_compatibility_fun(_basics)
 
+# Values that do not change between init() and shutdown(). They are cached so
+# that collectives do not call into the C library for them on every tensor.
+_cached_size = None
+_cached_local_size = None
+_cached_is_homogeneous = None
+_cached_nccl_built = None
+_cached_gpu_available = None
+
+# Adasum divisors for GPU and CPU tensors as (divisor, error message). They only
+# depend on the cluster topology, so they are resolved once after init(). The
+# error is raised when Adasum is used rather than in init(), which must keep
+# working on clusters that never use Adasum.
+_adasum_gpu = None
+_adasum_cpu = None
+
+# Whether collectives are completed in Python, see _local_handle(). Not done
+# when the timeline is enabled, since only the core records operations in it.
+_local_collectives = False
+
+
+def _post_init_refresh():
+    global _cached_size, _cached_local_size, _cached_is_homogeneous, _cached_nccl_built
+    global _adasum_gpu, _adasum_cpu, _local_collectives
+    _cached_size = size()
+    _cached_local_size = local_size()
+    _cached_is_homogeneous = is_homogeneous()
+    _cached_nccl_built = nccl_built()
+    _local_collectives = _cached_size == 1 and not os.environ.get('HOROVOD_TIMELINE')
+
+    if not _cached_nccl_built:
+        # Tensors are reduced on the CPU, see the warning in _allreduce_async().
+        _adasum_gpu = (1, None)
+    elif not _cached_is_homogeneous:
+        _adasum_gpu = (None, 'Running GPU Adasum on heterogeneous cluster is not supported yet.')
+    elif not num_rank_is_power_2(int(_cached_size / _cached_local_size)):
+        _adasum_gpu = (None, 'Running GPU Adasum with non-power of 2 nodes is not supported yet.')
+    else:
+        _adasum_gpu = (_cached_local_size, None)
+
+    if not num_rank_is_power_2(_cached_size):
+        _adasum_cpu = (None, 'Running Adasum with non-power of 2 ranks is not supported yet.')
+    else:
+        _adasum_cpu = (1, None)
+
+
+def _invalidate_cache():
+    global _cached_size, _cached_local_size, _cached_is_homogeneous, _cached_nccl_built
+    global _adasum_gpu, _adasum_cpu, _local_collectives
+    _cached_size = None
+    _cached_local_size = None
+    _cached_is_homogeneous = None
+    _cached_nccl_built = None
+    _adasum_gpu = None
+    _adasum_cpu = None
+    _local_collectives = False
+
+
+def _gpu_available():
+    # gpu_available() probes the extension in a subprocess, so it is only
+    # resolved once the first GPU collective needs it.
+    global _cached_gpu_available
+    if _cached_gpu_available is None:
+        _cached_gpu_available = gpu_available('torch')
+    return _cached_gpu_available
+
+
+def init(comm=None):
+    """A function that initializes Horovod.
+
+    Args:
+      comm: List specifying ranks for the communicator, relative to the MPI_COMM_WORLD
+        communicator OR the MPI communicator to use. Given communicator will be duplicated.
+        If None, Horovod will use MPI_COMM_WORLD Communicator.
+    """
+    _basics.init(comm)
+    _post_init_refresh()
+
+
+def shutdown():
+    """A function that shuts Horovod down."""
+    _invalidate_cache()
+    _basics.shutdown()
+
 
 # Schema: handle -> input, output
 # We keep input in order to make sure it does not get garbage collected
 # before the operation is finished.
+# Handles of batched allreduce map to a _FusionEntry instead.
 _handle_map = {}
 
+# Fusion buffer of a batched allreduce together with what synchronize() needs
+# to scatter the reduced buffer back to the outputs. pack_event is the CUDA
+# event recorded on the pack stream once the buffer was packed, or None.
+_FusionEntry = collections.namedtuple('_FusionEntry',
+                                      ['buffer', 'outputs', 'offsets', 'divisor', 'pack_event'])
+
 # Only support fp16 allreduce for PyTorch versions using v2 API.
 _fp16_supported = _v2_api
 
+# Size of the fusion buffers used by allreduce_async_batched(). Follows the
+# threshold of the C++ Tensor Fusion, which defaults to 64 MB.
+_fusion_threshold = int(os.environ.get('HOROVOD_FUSION_THRESHOLD', 64 * 1024 * 1024))
+
+# Schema: (dtype, device) -> list of idle fusion buffers
+# Buffers are handed back to the pool by synchronize() once the batched
+# allreduce that used them has finished.
+_fusion_buffer_pool = collections.defaultdict(list)
+
+# Schema: device -> CUDA stream used to pack fusion buffers on that device
+_pack_streams = {}
+
+# With a single process the collectives reduce to local copies, which are
+# completed without going through mpi_lib. Their handles count down from -1
+# so they never collide with the positive handles allocated by mpi_lib.
+_local_handles = itertools.count(-1, -1)
+
 
-def _check_function(function_factory, tensor):
-    function = function_factory(tensor)
-    if not hasattr(mpi_lib, function):
-        raise ValueError('Tensor type %s is not supported.' % tensor.type())
-    if not tensor.is_contiguous():
+def _local_handle(tensor, output):
+    handle = next(_local_handles)
+    _handle_map[handle] = (tensor, output)
+    return handle
+
+
+# Schema: name -> encoded name
+# Tensor names recur every training step, so their encoded bytes are reused.
+# The memo is reset when it grows past _MAX_ENCODED_NAMES, in case names are
+# generated per step.
+_encoded_names = {}
+_MAX_ENCODED_NAMES = 4096
+
+
+def _encode_name(name):
+    if name is None:
+        return _NULL
+    encoded = _encoded_names.get(name)
+    if encoded is None:
+        if len(_encoded_names) >= _MAX_ENCODED_NAMES:
+            _encoded_names.clear()
+        encoded = _encoded_names[name] = name.encode()
+    return encoded
+
+
+# Schema: (function factory, dtype, device type, layout) -> mpi_lib function
+# Resolving the function by name builds a type string on every call, so the
+# result is cached for each kind of tensor seen.
+_function_cache = {}
+
+
+def _check_function(function_factory, tensor, check_contiguous=True):
+    key = (function_factory, tensor.dtype, tensor.device.type, tensor.layout)
+    function = _function_cache.get(key)
+    if function is None:
+        function_name = function_factory(tensor)
+        if not hasattr(mpi_lib, function_name):
+            raise ValueError('Tensor type %s is not supported.' % tensor.type())
+        function = _function_cache[key] = getattr(mpi_lib, function_name)
+    if check_contiguous and not tensor.is_contiguous():
         raise ValueError('Tensor is required to be contiguous.')
     return function
 
@@ -91,40 +233,40 @@ def _allreduce_function_factory(tensor):
     return 'horovod_torch_allreduce_async_' + tensor.type().replace('.', '_')
 
 
-def _allreduce_async(tensor, output, name, op):
-    if tensor.dtype == torch.float16 and not _fp16_supported:
+def _allreduce_async(tensor, output, name, op, check_contiguous=True):
+    if not _fp16_supported and tensor.dtype == torch.float16:
         raise NotImplementedError(
             'float16 allreduce is not supported for PyTorch version {} < 1.0.0'
             .format(torch.__version__))
 
-    # Set the divisor for reduced gradients to average when necessary
+    # Set the divisor for reduced gradients to average when necessary.
+    # Averaging happens in framework code, so translate that to Sum for the actual call
+    true_op = op
     if op == Average:
-        divisor = size()
+        divisor = _cached_size or size()
+        true_op = Sum
     elif op == Adasum:
-        if tensor.device.type != 'cpu' and gpu_available('torch'):
-            if nccl_built():
-                if not is_homogeneous():
-                    raise NotImplementedError('Running GPU Adasum on heterogeneous cluster is not supported yet.')
-                elif not num_rank_is_power_2(int(size() / local_size())):
-                    raise NotImplementedError('Running GPU Adasum with non-power of 2 nodes is not supported yet.')
-                divisor = local_size()
-            else:
+        if _cached_size is None:
+            _post_init_refresh()
+        if tensor.device.type != 'cpu' and _gpu_available():
+            divisor, error = _adasum_gpu
+            if not _cached_nccl_built:
                 warnings.warn('Adasum reduction does not currently support GPU reduction using MPI. Tensors are '
                               'copied to CPU memory instead. To use Adasum for GPU reduction, please compile Horovod '
                               'with HOROVOD_GPU_ALLREDUCE=NCCL.')
-                divisor = 1
         else:
-            if not num_rank_is_power_2(size()):
-                raise NotImplementedError('Running Adasum with non-power of 2 ranks is not supported yet.')
-            divisor = 1
+            divisor, error = _adasum_cpu
+        if error is not None:
+            raise NotImplementedError(error)
     else:
         divisor = 1
-    # Averaging happens in framework code, so translate that to Sum for the actual call
-    true_op = Sum if op == Average else op
 
-    function = _check_function(_allreduce_function_factory, tensor)
-    handle = getattr(mpi_lib, function)(tensor, output, divisor,
-                                        name.encode() if name is not None else _NULL, true_op)
+    function = _check_function(_allreduce_function_factory, tensor, check_contiguous)
+    if _local_collectives:
+        if output is not tensor:
+            output.copy_(tensor)
+        return _local_handle(tensor, output)
+    handle = function(tensor, output, divisor, _encode_name(name), true_op)
     _handle_map[handle] = (tensor, output)
     return handle
 
@@ -150,7 +292,7 @@ def allreduce_async(tensor, average=None, name=None, op=None):
         A handle to the allreduce operation that can be used with `poll()` or
         `synchronize()`.
     """
-    op = handle_average_backwards_compatibility(op, average)
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
     output = tensor.new(tensor.shape)
     return _allreduce_async(tensor, output, name, op)
 
@@ -224,7 +366,7 @@ def allreduce_async_(tensor, average=None, name=None, op=None):
         A handle to the allreduce operation that can be used with `poll()` or
         `synchronize()`.
     """
-    op = handle_average_backwards_compatibility(op, average)
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
     return _allreduce_async(tensor, tensor, name, op)
 
 
@@ -253,19 +395,320 @@ def allreduce_(tensor, average=None, name=None, op=None):
     return synchronize(handle)
 
 
+def allreduce_async_multi(tensors, average=None, names=None, op=None):
+    """
+    A function that asynchronously performs averaging or summation of each of the
+    input tensors over all the Horovod processes. The input tensors are not modified.
+
+    All reductions are enqueued back-to-back before any of them is waited on, so the
+    background thread can negotiate and execute them concurrently.
+
+    The reduction operations are keyed by the names. If a name is not provided, an
+    incremented auto-generated name is used. The tensor types and shapes must be the
+    same on all Horovod processes for a given name. A reduction will not start until
+    all processes are ready to send and receive its tensor.
+
+    Arguments:
+        tensors: A list of tensors to reduce.
+        average: DEPRECATED, please use op instead.
+        names: A list with a name for each reduction operation, or None.
+        op: The reduction operation to combine tensors across different ranks. Defaults
+            to Average if None is given.
+
+    Returns:
+        A list of handles to the allreduce operations, in the order of `tensors`, that
+        can be used with `poll()` or `synchronize()`.
+    """
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
+    if names is None:
+        names = [None] * len(tensors)
+    return [_allreduce_async(tensor, tensor.new(tensor.shape), name, op)
+            for tensor, name in zip(tensors, names)]
+
+
+def allreduce_async_multi_(tensors, average=None, names=None, op=None):
+    """
+    A function that asynchronously performs in-place averaging or summation of each of
+    the input tensors over all the Horovod processes.
+
+    All reductions are enqueued back-to-back before any of them is waited on, so the
+    background thread can negotiate and execute them concurrently.
+
+    The reduction operations are keyed by the names. If a name is not provided, an
+    incremented auto-generated name is used. The tensor types and shapes must be the
+    same on all Horovod processes for a given name. A reduction will not start until
+    all processes are ready to send and receive its tensor.
+
+    Arguments:
+        tensors: A list of tensors to reduce.
+        average: DEPRECATED, please use op instead.
+        names: A list with a name for each reduction operation, or None.
+        op: The reduction operation to combine tensors across different ranks. Defaults
+            to Average if None is given.
+
+    Returns:
+        A list of handles to the allreduce operations, in the order of `tensors`, that
+        can be used with `poll()` or `synchronize()`.
+    """
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
+    if names is None:
+        names = [None] * len(tensors)
+    return [_allreduce_async(tensor, tensor, name, op)
+            for tensor, name in zip(tensors, names)]
+
+
+def _pack_stream(device):
+    stream = _pack_streams.get(device)
+    if stream is None:
+        stream = _pack_streams[device] = torch.cuda.Stream(device)
+    return stream
+
+
+# Schema: dtype -> element size in bytes
+_element_sizes = {}
+
+
+def _element_size(dtype):
+    element_size = _element_sizes.get(dtype)
+    if element_size is None:
+        element_size = torch.empty(0, dtype=dtype).element_size()
+        _element_sizes[dtype] = element_size
+    return element_size
+
+
+def _acquire_fusion_buffer(dtype, device, numel):
+    pool = _fusion_buffer_pool[(dtype, device)]
+    for i, buffer in enumerate(pool):
+        if buffer.numel() >= numel:
+            return pool.pop(i)
+    buffer_numel = max(_fusion_threshold // _element_size(dtype), numel)
+    return torch.empty(buffer_numel, dtype=dtype, device=device)
+
+
+def _release_fusion_buffer(buffer):
+    # Buffers sized for a single tensor above the fusion threshold are not
+    # kept, so they do not hold on to device memory once reduced.
+    if buffer.numel() * _element_size(buffer.dtype) > _fusion_threshold:
+        return
+    _fusion_buffer_pool[(buffer.dtype, buffer.device)].append(buffer)
+
+
+def _allocate_outputs(tensors):
+    """Allocates outputs as views into one contiguous block per dtype and device."""
+    numels = collections.OrderedDict()
+    for tensor in tensors:
+        key = (tensor.dtype, tensor.device)
+        numels[key] = numels.get(key, 0) + tensor.numel()
+    blocks = {key: torch.empty(numel, dtype=key[0], device=key[1])
+              for key, numel in numels.items()}
+
+    outputs = []
+    offsets = collections.defaultdict(int)
+    for tensor in tensors:
+        key = (tensor.dtype, tensor.device)
+        outputs.append(blocks[key].narrow(0, offsets[key], tensor.numel()).view(tensor.shape))
+        offsets[key] += tensor.numel()
+    return outputs
+
+
+def _pack_fusion_buffer(fused, tensors):
+    offsets = []
+    offset = 0
+    for tensor in tensors:
+        offsets.append(offset)
+        offset += tensor.numel()
+
+    # Fusion buffers are pooled, so no autograd history may be recorded in them.
+    with torch.no_grad():
+        if all(tensor.dtype == fused.dtype for tensor in tensors):
+            # A single concatenation packs the whole group with one kernel instead
+            # of launching one copy per tensor.
+            torch.cat([tensor.reshape(-1) for tensor in tensors], out=fused)
+        else:
+            for tensor, offset in zip(tensors, offsets):
+                fused.narrow(0, offset, tensor.numel()).view(tensor.shape).copy_(tensor)
+    return offsets
+
+
+def _unpack_fusion_buffer(entry):
+    if entry.pack_event is not None:
+        # Collectives completed locally do not wait for the pack stream, so the
+        # unpack has to.
+        torch.cuda.current_stream(entry.buffer.device).wait_event(entry.pack_event)
+    divisor = entry.divisor
+    with torch.no_grad():
+        for output, offset in zip(entry.outputs, entry.offsets):
+            reduced = entry.buffer.narrow(0, offset, output.numel()).view(output.shape)
+            if divisor == 1:
+                output.copy_(reduced)
+            elif output.dtype == reduced.dtype:
+                torch.div(reduced, divisor, out=output)
+            else:
+                output.copy_(reduced).div_(divisor)
+    _release_fusion_buffer(entry.buffer)
+    return entry.outputs
+
+
+def _fusion_groups(tensors, dtypes):
+    """Splits tensors into groups of the same dtype and device that fit in the fusion buffer."""
+    groups = []
+    open_groups = {}
+    for index, (tensor, dtype) in enumerate(zip(tensors, dtypes)):
+        key = (dtype, tensor.device)
+        nbytes = tensor.numel() * _element_size(dtype)
+        group = open_groups.get(key)
+        if group is not None and group[1] + nbytes > _fusion_threshold:
+            group = None
+        if group is None:
+            group = ([], 0)
+            groups.append(group[0])
+        group[0].append(index)
+        open_groups[key] = (group[0], group[1] + nbytes)
+    return groups
+
+
+def _allreduce_async_batched(tensors, outputs, name, op, compression):
+    if op == Adasum:
+        raise NotImplementedError('Adasum reduction does not support batched allreduce, '
+                                  'since it is not element-wise.')
+
+    # Floating point tensors are cast to the compressed type while being packed
+    # and cast back while being unpacked, so compression costs no extra copies.
+    compressed_dtype = compression.compressed_dtype
+    if compressed_dtype is None and compression is not Compression.none:
+        raise ValueError('Batched allreduce only supports compression algorithms that '
+                         'define compressed_dtype.')
+    dtypes = [compressed_dtype if compressed_dtype is not None and tensor.dtype.is_floating_point
+              else tensor.dtype for tensor in tensors]
+
+    handles = []
+    for group_id, group in enumerate(_fusion_groups(tensors, dtypes)):
+        group_tensors = [tensors[i] for i in group]
+        numel = sum(tensor.numel() for tensor in group_tensors)
+        buffer = _acquire_fusion_buffer(dtypes[group[0]], group_tensors[0].device, numel)
+        fused = buffer.narrow(0, 0, numel)
+        group_name = '%s.fused.%d' % (name, group_id) if name is not None else None
+
+        # Floating point averages are reduced as sums and divided while being
+        # unpacked, which saves a separate pass over the fusion buffer.
+        group_op = op
+        divisor = 1
+        if op == Average and fused.dtype.is_floating_point:
+            group_op = Sum
+            divisor = _cached_size or size()
+
+        # The fusion buffer is contiguous by construction, so its layout is not checked.
+        if fused.is_cuda:
+            # Pack on a side stream once the producers of the tensors are done.
+            # The allreduce is enqueued on the same stream, so its ready event
+            # fires when packing is done, while the current stream moves on.
+            stream = _pack_stream(fused.device)
+            stream.wait_stream(torch.cuda.current_stream(fused.device))
+            with torch.cuda.stream(stream):
+                offsets = _pack_fusion_buffer(fused, group_tensors)
+                handle = _allreduce_async(fused, fused, group_name, group_op,
+                                          check_contiguous=False)
+                pack_event = torch.cuda.Event()
+                pack_event.record(stream)
+            for tensor in group_tensors:
+                tensor.record_stream(stream)
+        else:
+            offsets = _pack_fusion_buffer(fused, group_tensors)
+            handle = _allreduce_async(fused, fused, group_name, group_op,
+                                      check_contiguous=False)
+            pack_event = None
+        # Replace the plain (tensor, output) entry with the data synchronize()
+        # needs to scatter the fused result back to the outputs.
+        _handle_map[handle] = _FusionEntry(buffer, [outputs[i] for i in group], offsets, divisor,
+                                           pack_event)
+        handles.append(handle)
+    return handles
+
+
+def allreduce_async_batched(tensors, average=None, name=None, op=None, compression=Compression.none):
+    """
+    A function that performs asynchronous averaging or summation of a list of input
+    tensors over all the Horovod processes. The input tensors are not modified.
+
+    Tensors of the same type and device are packed into fusion buffers of up to
+    `HOROVOD_FUSION_THRESHOLD` bytes (64 MB by default), so a single reduction is
+    issued per buffer instead of one per tensor. This is useful for models with
+    many small parameters.
+
+    The reduction operation is keyed by the name. If name is not provided, an incremented
+    auto-generated name is used. The tensor types and shapes must be the same on all
+    Horovod processes for a given name. The reduction will not start until all processes
+    are ready to send and receive the tensors.
+
+    Arguments:
+        tensors: A list of tensors to reduce.
+        average: DEPRECATED, please use op instead.
+        name: A name prefix of the reduction operations.
+        op: The reduction operation to combine tensors across different ranks. Defaults
+            to Average if None is given. Adasum is not supported.
+        compression: Compression algorithm used during allreduce to reduce the amount
+                     of data sent. Floating point tensors are cast to its
+                     `compressed_dtype` while being packed into the fusion buffer.
+                     Defaults to not using compression.
+
+    Returns:
+        A list of handles, one per fusion buffer, that can be used with `poll()` or
+        `synchronize()`. Synchronizing a handle returns the list of reduced tensors
+        packed in its fusion buffer.
+    """
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
+    outputs = _allocate_outputs(tensors)
+    return _allreduce_async_batched(tensors, outputs, name, op, compression)
+
+
+def allreduce_batched(tensors, average=None, name=None, op=None, compression=Compression.none):
+    """
+    A function that performs averaging or summation of a list of input tensors over
+    all the Horovod processes, packing them into fusion buffers. The input tensors
+    are not modified.
+
+    The reduction operation is keyed by the name. If name is not provided, an incremented
+    auto-generated name is used. The tensor types and shapes must be the same on all
+    Horovod processes for a given name. The reduction will not start until all processes
+    are ready to send and receive the tensors.
+
+    Arguments:
+        tensors: A list of tensors to reduce.
+        average: DEPRECATED, please use op instead.
+        name: A name prefix of the reduction operations.
+        op: The reduction operation to combine tensors across different ranks. Defaults
+            to Average if None is given. Adasum is not supported.
+        compression: Compression algorithm used during allreduce to reduce the amount
+                     of data sent. Floating point tensors are cast to its
+                     `compressed_dtype` while being packed into the fusion buffer.
+                     Defaults to not using compression.
+
+    Returns:
+        A list of tensors in the same order, shapes and types as `tensors`, averaged
+        or summed across all processes.
+    """
+    op = Average if op is None and average is None else handle_average_backwards_compatibility(op, average)
+    outputs = _allocate_outputs(tensors)
+    for handle in _allreduce_async_batched(tensors, outputs, name, op, compression):
+        synchronize(handle)
+    return outputs
+
+
 def _allgather_function_factory(tensor):
     return 'horovod_torch_allgather_async_' + tensor.type().replace('.', '_')
 
 
 def _allgather_async(tensor, output, name):
     function = _check_function(_allgather_function_factory, tensor)
-    handle = getattr(mpi_lib, function)(
-        tensor, output, name.encode() if name is not None else _NULL)
+    if _local_collectives and tensor.dim() > 0:
+        output.resize_(tensor.shape).copy_(tensor)
+        return _local_handle(tensor, output)
+    handle = function(tensor, output, _encode_name(name))
     _handle_map[handle] = (tensor, output)
     return handle
 
 
-def allgather_async(tensor, name=None):
+def allgather_async(tensor, name=None, equal_split=False):
     """
     A function that asynchronously concatenates the input tensor with the same input
     tensor on all other Horovod processes. The input tensor is not modified.
@@ -277,37 +720,61 @@ def allgather_async(tensor, name=None):
     Arguments:
         tensor: A tensor to allgather.
         name: A name of the allgather operation.
+        equal_split: Whether the input tensors on all processes have the same shape.
+                     If True, the output is allocated upfront instead of being
+                     resized by the background thread. It is the caller's
+                     responsibility to pass tensors of the same shape on all processes.
 
     Returns:
         A handle to the allgather operation that can be used with `poll()` or
         `synchronize()`.
     """
-    output = tensor.new()
+    if equal_split and tensor.dim() > 0:
+        output = tensor.new_empty((tensor.shape[0] * (_cached_size or size()),) + tensor.shape[1:])
+    else:
+        output = tensor.new()
     return _allgather_async(tensor, output, name)
 
 
+# Per-thread scratch tensor that HorovodAllgather.backward sends its first
+# dimension in. Backward passes may run on several autograd threads.
+_dim_scratch = threading.local()
+
+
+def _dim_tensor(dim):
+    tensor = getattr(_dim_scratch, 'tensor', None)
+    if tensor is None:
+        tensor = _dim_scratch.tensor = torch.IntTensor(1)
+    return tensor.fill_(dim)
+
+
 class HorovodAllgather(torch.autograd.Function):
     """An autograd function that performs allgather on a tensor."""
 
     @staticmethod
-    def forward(ctx, tensor, name):
+    def forward(ctx, tensor, name, equal_split):
         ctx.dim = tensor.shape[0]
-        handle = allgather_async(tensor, name)
+        ctx.equal_split = equal_split
+        handle = allgather_async(tensor, name, equal_split)
         return synchronize(handle)
 
     @staticmethod
     def backward(ctx, grad_output):
         grad_reduced = allreduce(grad_output, average=False)
 
-        dim_t = torch.IntTensor([ctx.dim])
-        dim = allgather(dim_t).view(size())
+        if ctx.equal_split:
+            # Every rank contributed ctx.dim rows, so the sizes need not be gathered.
+            return grad_reduced.narrow(0, rank() * ctx.dim, ctx.dim), None, None
+
+        dim = allgather(_dim_tensor(ctx.dim)).view(size())
 
-        r = rank()
-        offset = torch.sum(dim.narrow(0, 0, r)).item() if r != 0 else 0
-        return grad_reduced.narrow(0, offset, ctx.dim), None
+        # The gathered first dimensions are a tiny CPU tensor, so compute the
+        # prefix sum in Python instead of launching a reduction.
+        offset = sum(dim.tolist()[:rank()])
+        return grad_reduced.narrow(0, offset, ctx.dim), None, None
 
 
-def allgather(tensor, name=None):
+def allgather(tensor, name=None, equal_split=False):
     """
     A function that concatenates the input tensor with the same input tensor on
     all other Horovod processes. The input tensor is not modified.
@@ -323,6 +790,11 @@ def allgather(tensor, name=None):
     Arguments:
         tensor: A tensor to allgather.
         name: A name of the allgather operation.
+        equal_split: Whether the input tensors on all processes have the same shape.
+                     If True, the output is allocated upfront and the backward pass
+                     does not need to gather the first dimensions of all processes.
+                     It is the caller's responsibility to pass tensors of the same
+                     shape on all processes.
 
     Returns:
         A tensor of the same type as `tensor`, concatenated on dimension zero
@@ -330,7 +802,7 @@ def allgather(tensor, name=None):
         the first dimension, which may be greater and is the sum of all first
         dimensions of the tensors in different Horovod processes.
     """
-    return HorovodAllgather.apply(tensor, name)
+    return HorovodAllgather.apply(tensor, name, equal_split)
 
 
 def _broadcast_function_factory(tensor):
@@ -339,8 +811,11 @@ def _broadcast_function_factory(tensor):
 
 def _broadcast_async(tensor, output, root_rank, name):
     function = _check_function(_broadcast_function_factory, tensor)
-    handle = getattr(mpi_lib, function)(
-        tensor, output, root_rank, name.encode() if name is not None else _NULL)
+    if _local_collectives and root_rank == 0:
+        if output is not tensor:
+            output.copy_(tensor)
+        return _local_handle(tensor, output)
+    handle = function(tensor, output, root_rank, _encode_name(name))
     _handle_map[handle] = (tensor, output)
     return handle
 
@@ -381,7 +856,7 @@ class HorovodBroadcast(torch.autograd.Function):
     def backward(ctx, grad_output):
         grad_reduced = allreduce(grad_output, average=False)
         if rank() != ctx.root_rank:
-            grad_reduced *= 0
+            grad_reduced.zero_()
         return grad_reduced, None, None
 
 
@@ -469,6 +944,8 @@ def poll(handle):
     Returns:
         A flag indicating whether the operation has completed.
     """
+    if handle < 0:
+        return True
     return mpi_lib.horovod_torch_poll(handle) != 0
 
 
@@ -482,13 +959,17 @@ def synchronize(handle):
                 operation.
 
     Returns:
-        An output tensor of the operation.
+        An output tensor of the operation, or the list of output tensors for a
+        handle returned by `allreduce_async_batched()`.
     """
-    if handle not in _handle_map:
+    entry = _handle_map.pop(handle, None)
+    if entry is None:
         return
-    mpi_lib.horovod_torch_wait_and_clear(handle)
-    _, output = _handle_map.pop(handle)
-    return output
+    if handle > 0:
+        mpi_lib.horovod_torch_wait_and_clear(handle)
+    if isinstance(entry, _FusionEntry):
+        return _unpack_fusion_buffer(entry)
+    return entry[1]
 
 
 def join(device=-1):
@@ -84,8 +84,18 @@ int DoAllreduceCudaOnCPU(::torch::Tensor tensor, ::torch::Tensor output, int div
 
   // Make async copy of input tensor to CPU tensor and record completion event.
   auto device = GetDeviceID(tensor);
+#if TORCH_VERSION >= 1002000000
+  // Copy into pinned memory, so the non-blocking copy is an actual async DMA
+  // transfer rather than a staged copy through pageable memory. The caching
+  // host allocator hands the same pinned blocks out again on later calls.
+  auto cpu_buffer = ::torch::empty(
+      tensor.sizes(),
+      tensor.options().device(::torch::kCPU).pinned_memory(true));
+  cpu_buffer.copy_(tensor, /*non_blocking=*/true);
+#else
   auto cpu_buffer =
       tensor.to(::torch::Device(::torch::kCPU), /*non_blocking=*/true);
+#endif
   auto hvd_cpu_buffer = std::make_shared<TorchTensor>(cpu_buffer);
   auto ready_event = RecordReadyEvent(device);
 
@@ -236,8 +236,10 @@ class TorchTests(unittest.TestCase):
             multiplied = tensor * size
             tests.append((dtype, multiplied, handle))
 
-        # Make sure it's an asynchronous operation.
-        assert is_hvd_poll_false_once, 'hvd.poll() always returns True, not an async op?'
+        # Make sure it's an asynchronous operation. With a single process
+        # the operation completes locally.
+        if size > 1:
+            assert is_hvd_poll_false_once, 'hvd.poll() always returns True, not an async op?'
 
         for dtype, multiplied, handle in tests:
             summed = hvd.synchronize(handle)
@@ -258,6 +260,191 @@ class TorchTests(unittest.TestCase):
 
             assert max_difference <= threshold, 'hvd.allreduce produces incorrect results'
 
+    def test_horovod_allreduce_async_multi(self):
+        """Test that the multi-tensor allreduce correctly sums a list of tensors,
+        both out-of-place and in-place."""
+        hvd.init()
+        size = hvd.size()
+        dtypes = self.filter_supported_types([torch.IntTensor, torch.LongTensor,
+                  torch.FloatTensor, torch.DoubleTensor])
+        if torch.cuda.is_available():
+            dtypes += [torch.cuda.IntTensor, torch.cuda.LongTensor,
+                       torch.cuda.FloatTensor, torch.cuda.DoubleTensor]
+        tensors = []
+        for dtype in dtypes:
+            torch.manual_seed(1234)
+            tensor = torch.FloatTensor(17, 17).random_(-100, 100)
+            tensors.append(self.cast_and_place(tensor, dtype))
+        names = ['multi.%d' % i for i in range(len(tensors))]
+
+        handles = hvd.allreduce_async_multi(tensors, names=names, op=hvd.Sum)
+        summed = [hvd.synchronize(handle) for handle in handles]
+
+        inplace = [tensor.clone() for tensor in tensors]
+        handles = hvd.allreduce_async_multi_(inplace, average=False)
+        for handle in handles:
+            hvd.synchronize(handle)
+
+        for tensor, result, result_inplace in zip(tensors, summed, inplace):
+            max_difference = max(result.sub(tensor * size).max(),
+                                 result_inplace.sub(tensor * size).max())
+
+            # Threshold for floating point equality depends on number of
+            # ranks, since we're comparing against precise multiplication.
+            if size <= 3 or tensor.dtype in [torch.int32, torch.int64]:
+                threshold = 0
+            elif size < 10:
+                threshold = 1e-4
+            elif size < 15:
+                threshold = 5e-4
+            else:
+                break
+
+            assert max_difference <= threshold, 'hvd.allreduce_async_multi produces incorrect results'
+
+    def test_horovod_allreduce_batched(self):
+        """Test that the batched allreduce correctly sums tensors of mixed types
+        and shapes packed into fusion buffers."""
+        hvd.init()
+        size = hvd.size()
+        dtypes = self.filter_supported_types([torch.IntTensor, torch.LongTensor,
+                  torch.FloatTensor, torch.DoubleTensor])
+        if torch.cuda.is_available():
+            dtypes += [torch.cuda.IntTensor, torch.cuda.LongTensor,
+                       torch.cuda.FloatTensor, torch.cuda.DoubleTensor]
+        dims = [1, 2, 3]
+        tensors = []
+        for dtype, dim in itertools.product(dtypes, dims):
+            torch.manual_seed(1234)
+            tensor = torch.FloatTensor(*([17] * dim)).random_(-100, 100)
+            tensors.append(self.cast_and_place(tensor, dtype))
+
+        handles = hvd.allreduce_async_batched(tensors, average=False, name='batched')
+        assert len(handles) <= len(dtypes), 'hvd.allreduce_async_batched did not fuse tensors'
+        for handle in handles:
+            hvd.synchronize(handle)
+
+        summed = hvd.allreduce_batched(tensors, op=hvd.Sum)
+        for tensor, result in zip(tensors, summed):
+            assert result.shape == tensor.shape
+            assert result.type() == tensor.type()
+            max_difference = result.sub(tensor * size).max()
+
+            # Threshold for floating point equality depends on number of
+            # ranks, since we're comparing against precise multiplication.
+            if size <= 3 or tensor.dtype in [torch.int32, torch.int64]:
+                threshold = 0
+            elif size < 10:
+                threshold = 1e-4
+            elif size < 15:
+                threshold = 5e-4
+            else:
+                break
+
+            assert max_difference <= threshold, 'hvd.allreduce_batched produces incorrect results'
+
+    def test_horovod_allreduce_batched_requires_grad(self):
+        """Test that the batched allreduce accepts tensors that require grad,
+        such as model parameters, and keeps autograd out of fusion buffers."""
+        hvd.init()
+        size = hvd.size()
+        model = torch.nn.Sequential(torch.nn.Linear(17, 17), torch.nn.Linear(17, 3))
+        if torch.cuda.is_available():
+            model.cuda(hvd.local_rank())
+        hvd.broadcast_parameters(model.state_dict(), root_rank=0)
+        parameters = list(model.parameters())
+
+        # The second call reuses the pooled fusion buffers of the first.
+        for name in ['batched.grad.0', 'batched.grad.1']:
+            summed = hvd.allreduce_batched(parameters, op=hvd.Sum, name=name)
+            for parameter, result in zip(parameters, summed):
+                assert not result.requires_grad
+                max_difference = result.sub(parameter.detach() * size).abs().max()
+                assert max_difference <= 1e-4, 'hvd.allreduce_batched produces incorrect results'
+
+            averaged = hvd.allreduce_batched(parameters, name=name + '.average')
+            for parameter, result in zip(parameters, averaged):
+                max_difference = result.sub(parameter.detach()).abs().max()
+                assert max_difference <= 1e-4, 'hvd.allreduce_batched produces incorrect results'
+
+    def test_horovod_allreduce_batched_average(self):
+        """Test that the batched allreduce correctly averages tensors."""
+        hvd.init()
+        size = hvd.size()
+        dtypes = self.filter_supported_types([torch.IntTensor, torch.LongTensor,
+                  torch.FloatTensor, torch.DoubleTensor])
+        if torch.cuda.is_available():
+            dtypes += [torch.cuda.IntTensor, torch.cuda.LongTensor,
+                       torch.cuda.FloatTensor, torch.cuda.DoubleTensor]
+        dims = [1, 2, 3]
+        tensors = []
+        for dtype, dim in itertools.product(dtypes, dims):
+            torch.manual_seed(1234)
+            tensor = torch.FloatTensor(*([17] * dim)).random_(-100, 100)
+            tensors.append(self.cast_and_place(tensor, dtype))
+
+        averaged = hvd.allreduce_batched(tensors)
+        for tensor, result in zip(tensors, averaged):
+            max_difference = result.sub(tensor).max()
+
+            # Threshold for floating point equality depends on number of
+            # ranks, since we're comparing against precise multiplication.
+            if size <= 3 or tensor.dtype in [torch.int32, torch.int64]:
+                threshold = 0
+            elif size < 10:
+                threshold = 1e-4
+            elif size < 15:
+                threshold = 5e-4
+            else:
+                break
+
+            assert max_difference <= threshold, 'hvd.allreduce_batched produces incorrect results'
+
+    def test_horovod_allreduce_batched_fp16_compression(self):
+        """Test that the batched allreduce casts floating point tensors to 16-bit
+        and back while packing them into fusion buffers."""
+        if not _fp16_supported:
+            return
+        hvd.init()
+        size = hvd.size()
+        dtypes = [torch.float32, torch.float64, torch.int32]
+        tensors = [torch.ones([17] * 2, dtype=dtype) for dtype in dtypes]
+        if torch.cuda.is_available():
+            tensors += [tensor.cuda(hvd.local_rank()) for tensor in tensors]
+
+        summed = hvd.allreduce_batched(tensors, op=hvd.Sum,
+                                       compression=hvd.Compression.fp16)
+        for tensor, result in zip(tensors, summed):
+            self.assertEqual(result.dtype, tensor.dtype)
+            self.assertEqual(result.device, tensor.device)
+            max_difference = result.sub(tensor * size).abs().max()
+            assert max_difference == 0, 'hvd.allreduce_batched produces incorrect results'
+
+    def test_horovod_local_handles(self):
+        """Test that with a single process the async collectives complete
+        locally and their handles work with poll() and synchronize()."""
+        hvd.init()
+        # This test only applies if there is only one worker.
+        if hvd.size() != 1 or os.environ.get('HOROVOD_TIMELINE'):
+            return
+
+        tensor = torch.FloatTensor(17, 17).random_(-100, 100)
+        handles = [hvd.allreduce_async(tensor, name='local.allreduce'),
+                   hvd.allgather_async(tensor, name='local.allgather'),
+                   hvd.broadcast_async(tensor, root_rank=0, name='local.broadcast')]
+        for handle in handles:
+            assert handle < 0, 'collective was not completed locally'
+            assert hvd.poll(handle), 'hvd.poll() returned False for a local handle'
+            result = hvd.synchronize(handle)
+            assert result is not tensor
+            assert result.equal(tensor), 'local collective produces incorrect results'
+            assert hvd.synchronize(handle) is None
+
+        inplace = tensor.clone()
+        handle = hvd.allreduce_async_(inplace, name='local.allreduce_')
+        assert hvd.synchronize(handle) is inplace
+        assert inplace.equal(tensor), 'local collective produces incorrect results'
+
     def test_horovod_allreduce_multi_gpu(self):
         """Test that the allreduce works on multiple GPUs."""
         # Only do this test if there are GPUs available.
@@ -570,8 +757,10 @@ class TorchTests(unittest.TestCase):
                 is_hvd_poll_false_once = True
             tests.append((handle, rank_shape))
 
-        # Make sure it's an asynchronous operation.
-        assert is_hvd_poll_false_once, 'hvd.poll() always returns True, not an async op?'
+        # Make sure it's an asynchronous operation. With a single process
+        # the operation completes locally.
+        if size > 1:
+            assert is_hvd_poll_false_once, 'hvd.poll() always returns True, not an async op?'
 
         for handle, rank_shape in tests:
             gathered = hvd.synchronize(handle)
@@ -693,6 +882,37 @@ class TorchTests(unittest.TestCase):
                             "gradient %s differs from expected %s, "
                             "error: %s" % (grad_out, expected, str(err)))
 
+    def test_horovod_allgather_grad_equal_split(self):
+        """Test the correctness of the allgather gradient when all ranks
+        gather tensors of the same shape."""
+        hvd.init()
+        rank = hvd.rank()
+        size = hvd.size()
+
+        # Only Tensors of floating point dtype can require gradients
+        dtypes = [torch.FloatTensor, torch.DoubleTensor]
+        if torch.cuda.is_available():
+            dtypes += [torch.cuda.FloatTensor, torch.cuda.DoubleTensor]
+        dims = [1, 2, 3]
+        for dtype, dim in itertools.product(dtypes, dims):
+            tensor = torch.FloatTensor(*([17] * dim)).fill_(1).mul_(rank)
+            tensor = self.cast_and_place(tensor, dtype)
+            tensor.requires_grad_()
+
+            grad_ys = torch.cat([self.cast_and_place(torch.ones([17] * dim), dtype) * r
+                                 for r in range(size)], dim=0)
+
+            gathered = hvd.allgather(tensor, equal_split=True)
+            assert list(gathered.shape) == [17 * size] + [17] * (dim - 1)
+            gathered.backward(grad_ys)
+            grad_out = tensor.grad.data.cpu().numpy()
+
+            expected = np.ones([17] * dim) * rank * size
+            err = np.linalg.norm(expected - grad_out)
+            self.assertLess(err, 0.00000001,
+                            "gradient %s differs from expected %s, "
+                            "error: %s" % (grad_out, expected, str(err)))
+
     def test_horovod_broadcast(self):
         """Test that the broadcast correctly broadcasts 1D, 2D, 3D tensors."""
         hvd.init()
@@ -1249,6 +1469,44 @@ class TorchTests(unittest.TestCase):
         loss.backward()
         opt.step()
 
+    def test_distributed_optimizer_multiple_steps(self):
+        """Test that DistributedOptimizer applies the delayed allreduce results
+        over several steps, with and without compression."""
+        hvd.init()
+        size = hvd.size()
+
+        # This test does not apply if there is only one worker.
+        if size == 1:
+            return
+
+        compressions = [hvd.Compression.none]
+        if _fp16_supported:
+            compressions.append(hvd.Compression.fp16)
+
+        N, D_in, H, D_out = 64, 100, 10, 10
+        for i, compression in enumerate(compressions):
+            torch.manual_seed(1234)
+            x = torch.randn(N, D_in)
+            y = torch.randn(N, D_out)
+            model = torch.nn.Sequential(
+                torch.nn.Linear(D_in, H), torch.nn.ReLU(), torch.nn.Linear(H, D_out))
+            hvd.broadcast_parameters(model.state_dict(), root_rank=0)
+            opt = torch.optim.SGD(model.parameters(), lr=0.01, momentum=0.9)
+            # Allreduces of the last step stay in flight, so use unique names per model.
+            named_parameters = [('%d.%s' % (i, name), p) for name, p in model.named_parameters()]
+            opt = hvd.DistributedOptimizer(
+                opt, named_parameters=named_parameters, compression=compression)
+
+            for _ in range(3):
+                opt.zero_grad()
+                loss = F.mse_loss(model(x), y)
+                loss.backward()
+                opt.step()
+
+            for p in model.parameters():
+                assert np.isfinite(p.data.numpy()).all(), 'DistributedOptimizer produced invalid parameters'
+                assert p.reduce.dtype == p.dtype, 'allreduce result was not decompressed'
+
     def test_delta_optimizer(self):
         """Test that delta optimizer."""
         hvd.init()